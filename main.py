@@ -1,4 +1,7 @@
 import sys
+import os
+import json
+import hashlib
 import time
 from pysat.solvers import Glucose3
 
@@ -28,6 +31,19 @@ class SudokuBoard:
             print(f"Error loading file: {e}")
             sys.exit(1)
 
+    def load_string(self, puzzle):
+        # One puzzle per line, 81 chars, '0' or '.' for empty cells
+        puzzle = puzzle.strip()
+        if len(puzzle) != self.N * self.N:
+            raise ValueError("Invalid puzzle length")
+        for i, char in enumerate(puzzle):
+            val = int(char) if char.isdigit() else 0
+            self.grid[i // self.N][i % self.N] = val
+            self.original_grid[i // self.N][i % self.N] = val
+
+    def to_string(self):
+        return "".join(str(v) if v > 0 else "." for row in self.grid for v in row)
+
     def update_cell(self, r, c, val):
         self.grid[r][c] = val
 
@@ -189,7 +205,185 @@ class SudokuAgent:
         print(f"  - Propagations:         {m['propagations']}")
         print("="*40 + "\n")
 
+class ResultStream:
+    # Ordered, append-only results writer with periodic checkpoints.
+    # Each line of the results file is "<index> <status> <grid>". The
+    # checkpoint records the last completed index, the byte offset of the
+    # results file at that point, the aggregated metrics and the source it
+    # was built from, so a restarted job truncates any half-written tail and
+    # continues after last_index. An empty checkpoint is written on open, so
+    # a results file without one is never ours to overwrite.
+    STATUSES = ('solved', 'unsolved', 'invalid')
+
+    def __init__(self, results_file, checkpoint_every=1000, source=None, buffer_size=1 << 20):
+        if checkpoint_every < 1:
+            raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+        self.results_file = results_file
+        self.checkpoint_file = results_file + ".ckpt"
+        self.checkpoint_every = checkpoint_every
+        self.source = source
+        self.last_index = -1
+        self.pending = 0
+        self.metrics = {
+            'solved': 0,
+            'unsolved': 0,
+            'invalid': 0,
+            'time_gen': 0.0,
+            'time_solve': 0.0,
+            'conflicts': 0,
+            'decisions': 0,
+            'propagations': 0
+        }
+
+        offset = 0
+        if os.path.exists(self.checkpoint_file):
+            with open(self.checkpoint_file, "r") as f:
+                state = json.load(f)
+            if source is not None and state.get('source') != source:
+                raise ValueError(f"Checkpoint {self.checkpoint_file} was made for a different input: "
+                                 f"{state.get('source')} != {source}")
+            size = os.path.getsize(results_file) if os.path.exists(results_file) else -1
+            if size < state['offset']:
+                raise ValueError(f"Results file {results_file} is missing or shorter than its checkpoint "
+                                 f"({size} < {state['offset']} bytes)")
+            self.last_index = state['last_index']
+            offset = state['offset']
+            self.metrics.update(state['metrics'])
+        elif os.path.exists(results_file) and os.path.getsize(results_file) > 0:
+            raise ValueError(f"Results file {results_file} is not empty and has no checkpoint")
+
+        # Drop anything written after the last checkpoint; it gets redone
+        self.f = open(results_file, "a+b", buffering=buffer_size)
+        self.f.truncate(offset)
+        self.f.seek(offset)
+        if offset == 0:
+            self.checkpoint()
+
+    def write(self, index, status, board=None, metrics=None):
+        if status not in self.STATUSES:
+            raise ValueError(f"Unknown status: {status}")
+        if index <= self.last_index:
+            raise ValueError(f"Out of order result: {index} <= {self.last_index}")
+        grid = board.to_string() if board is not None else "-"
+        self.f.write(f"{index} {status} {grid}\n".encode())
+
+        m = self.metrics
+        m[status] += 1
+        if metrics:
+            m['time_gen'] += metrics['time_gen']
+            m['time_solve'] += metrics['time_solve']
+            m['conflicts'] += metrics['conflicts']
+            m['decisions'] += metrics['decisions']
+            m['propagations'] += metrics['propagations']
+
+        self.last_index = index
+        self.pending += 1
+        if self.pending >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        # Results must be durable before the checkpoint that points past them
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        state = {
+            'last_index': self.last_index,
+            'offset': self.f.tell(),
+            'metrics': self.metrics,
+            'source': self.source
+        }
+        tmp_file = self.checkpoint_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.checkpoint_file)
+        self.pending = 0
+
+    def close(self):
+        self.checkpoint()
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # On an error the counters may not match the buffered lines, so keep
+        # the last periodic checkpoint; resume truncates anything after it
+        if exc_type is None:
+            self.close()
+        else:
+            self.f.close()
+        return False
+
+def corpus_fingerprint(corpus_file, chunk_size=1 << 20):
+    # Identifies a corpus by its size and content, wherever it is mounted
+    h = hashlib.sha1()
+    size = 0
+    with open(corpus_file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+            size += len(chunk)
+    return {
+        'size': size,
+        'sha1': h.hexdigest()
+    }
+
+def run_batch(corpus_file, results_file, checkpoint_every=1000):
+    # Solve one puzzle per line of corpus_file, resuming from the checkpoint
+    source = corpus_fingerprint(corpus_file)
+    with ResultStream(results_file, checkpoint_every, source) as stream:
+        if stream.last_index >= 0:
+            print(f"Resuming after puzzle #{stream.last_index}")
+        with open(corpus_file, "r") as f:
+            for index, line in enumerate(f):
+                if index <= stream.last_index or not line.strip():
+                    continue
+                board = SudokuBoard()
+                try:
+                    board.load_string(line)
+                except ValueError:
+                    stream.write(index, 'invalid')
+                    continue
+                agent = SudokuAgent()
+                if agent.solve(board):
+                    stream.write(index, 'solved', board, agent.metrics)
+                else:
+                    stream.write(index, 'unsolved', None, agent.metrics)
+        return stream.metrics
+
+def print_batch_report(m):
+    print("\n" + "="*40)
+    print(f" Batch Summary")
+    print(f"  - Solved:               {m['solved']}")
+    print(f"  - Unsolved:             {m['unsolved']}")
+    print(f"  - Invalid:              {m['invalid']}")
+    print("-" * 40)
+    print(f" Performance (totals)")
+    print(f"  - Constraint Gen Time:  {m['time_gen']:.6f}s")
+    print(f"  - Solving Time:         {m['time_solve']:.6f}s")
+    print(f"  - Conflicts:            {m['conflicts']}")
+    print(f"  - Decisions:            {m['decisions']}")
+    print(f"  - Propagations:         {m['propagations']}")
+    print("="*40 + "\n")
+
 if __name__ == '__main__':
+    # Batch mode: python main.py --batch corpus.txt results.txt [checkpoint_every]
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        usage = "Usage: python main.py --batch <corpus> <results> [checkpoint_every]"
+        try:
+            every = int(sys.argv[4]) if len(sys.argv) > 4 else 1000
+        except ValueError:
+            every = 0
+        if len(sys.argv) < 4 or every < 1:
+            print(usage)
+            sys.exit(1)
+        try:
+            print_batch_report(run_batch(sys.argv[2], sys.argv[3], every))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
     input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
     
     # Init environment
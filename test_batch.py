@@ -0,0 +1,158 @@
+import pytest
+
+import main
+from main import ResultStream, SudokuBoard, corpus_fingerprint, run_batch
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+STATS = {'time_gen': 0.5, 'time_solve': 0.25, 'conflicts': 2, 'decisions': 3, 'propagations': 4}
+
+
+def write_unclosed(results, count, every):
+    # Simulates a crash: results are written but close() never runs
+    stream = ResultStream(str(results), every)
+    for i in range(count):
+        stream.write(i, 'unsolved', None, STATS)
+    stream.f.close()
+
+
+def test_resume_truncates_unchecked_tail(tmp_path):
+    results = tmp_path / "r.txt"
+    write_unclosed(results, 5, 3)
+    assert results.read_bytes().count(b"\n") == 5
+
+    stream = ResultStream(str(results), 3)
+    assert stream.last_index == 2
+    assert stream.metrics['unsolved'] == 3
+    assert stream.metrics['conflicts'] == 6
+    assert stream.metrics['time_gen'] == pytest.approx(1.5)
+    stream.write(3, 'invalid')
+    stream.close()
+    assert results.read_text() == "0 unsolved -\n1 unsolved -\n2 unsolved -\n3 invalid -\n"
+
+
+def test_out_of_order_write_rejected(tmp_path):
+    with ResultStream(str(tmp_path / "r.txt"), 10) as stream:
+        stream.write(0, 'invalid')
+        with pytest.raises(ValueError):
+            stream.write(0, 'invalid')
+
+
+def test_unknown_status_rejected(tmp_path):
+    with ResultStream(str(tmp_path / "r.txt"), 10) as stream:
+        with pytest.raises(ValueError):
+            stream.write(0, 'timeout')
+        assert stream.metrics['unsolved'] == 0
+    assert (tmp_path / "r.txt").read_text() == ""
+
+
+def test_exit_keeps_last_checkpoint_after_exception(tmp_path):
+    results = tmp_path / "r.txt"
+    with pytest.raises(KeyboardInterrupt):
+        with ResultStream(str(results), 2) as stream:
+            for i in range(3):
+                stream.write(i, 'unsolved', None, STATS)
+            raise KeyboardInterrupt
+
+    with ResultStream(str(results), 2) as stream:
+        assert stream.last_index == 1
+        assert stream.metrics['unsolved'] == 2
+    assert results.read_text() == "0 unsolved -\n1 unsolved -\n"
+
+
+def test_crash_before_first_checkpoint_resumes(tmp_path):
+    results = tmp_path / "r.txt"
+    write_unclosed(results, 2, 100)
+
+    with ResultStream(str(results), 100) as stream:
+        assert stream.last_index == -1
+        assert stream.metrics['unsolved'] == 0
+    assert results.read_text() == ""
+
+
+def test_existing_file_without_checkpoint_rejected(tmp_path):
+    results = tmp_path / "keep.txt"
+    results.write_text("do not overwrite\n")
+
+    with pytest.raises(ValueError):
+        ResultStream(str(results), 2)
+    assert results.read_text() == "do not overwrite\n"
+
+
+def test_missing_results_file_rejected(tmp_path):
+    results = tmp_path / "r.txt"
+    write_unclosed(results, 3, 3)
+    results.unlink()
+
+    with pytest.raises(ValueError):
+        ResultStream(str(results), 3)
+    assert not results.exists()
+
+
+def test_checkpoint_every_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        ResultStream(str(tmp_path / "r.txt"), 0)
+
+
+def test_resume_with_other_corpus_rejected(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(PUZZLE + "\nbad\n")
+    results = tmp_path / "r.txt"
+    metrics = run_batch(str(corpus), str(results), 1)
+    assert metrics['solved'] == 1
+    assert metrics['invalid'] == 1
+
+    # Same corpus resumes with nothing left to do
+    assert run_batch(str(corpus), str(results), 1) == metrics
+
+    other = tmp_path / "other.txt"
+    other.write_text(PUZZLE + "\n")
+    with pytest.raises(ValueError):
+        run_batch(str(other), str(results), 1)
+
+
+def test_run_batch_resumes_partway(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text((PUZZLE + "\n") * 5)
+    results = tmp_path / "r.txt"
+
+    solve = main.SudokuAgent.solve
+    calls = []
+
+    def preempted(agent, board):
+        calls.append(1)
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+        return solve(agent, board)
+
+    monkeypatch.setattr(main.SudokuAgent, "solve", preempted)
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(str(corpus), str(results), 2)
+    monkeypatch.setattr(main.SudokuAgent, "solve", solve)
+
+    metrics = run_batch(str(corpus), str(results), 2)
+    assert metrics['solved'] == 5
+    indices = [int(line.split()[0]) for line in results.read_text().splitlines()]
+    assert indices == [0, 1, 2, 3, 4]
+
+
+def test_corpus_fingerprint_tracks_content(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text((PUZZLE + "\n") * 2000)
+    before = corpus_fingerprint(str(corpus))
+
+    # Same size, changed past the first 64 KiB
+    edited = (PUZZLE + "\n") * 1999 + PUZZLE.replace("5", "4", 1) + "\n"
+    corpus.write_text(edited)
+    after = corpus_fingerprint(str(corpus))
+    assert after != before
+
+    # Same content at a new path
+    moved = tmp_path / "moved.txt"
+    corpus.rename(moved)
+    assert corpus_fingerprint(str(moved)) == after
+
+
+def test_load_string_round_trip():
+    board = SudokuBoard()
+    board.load_string(PUZZLE)
+    assert board.to_string() == PUZZLE